@@ -6,8 +6,6 @@ fmdtools CLI package for scaffolding and template generation.
 
 from .main import app, main
 from .schemas import LevelSpec, FunctionSpec, FlowSpec, ArchitectureSpec
-from .generate import render_level
-from .ai_adapter import AIWizard
 
 __all__ = [
     'app',
@@ -20,3 +18,14 @@ __all__ = [
     'AIWizard'
 ]
 
+
+def __getattr__(name):
+    # The generator and AI wizard are only imported on access so that
+    # starting the CLI stays cheap
+    if name == 'render_level':
+        from .generate import render_level
+        return render_level
+    if name == 'AIWizard':
+        from .ai_adapter import AIWizard
+        return AIWizard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
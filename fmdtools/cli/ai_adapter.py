@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+from functools import lru_cache
 from time import sleep
 from typing import Dict, Any, List, Optional
 
@@ -35,9 +36,17 @@ Rules:
 - For architecture, ensure logical connections between functions.
 """
 
+WELCOME_TEXT = "\n".join([
+    "\nAI Wizard Mode",
+    "=" * 50,
+    "I'll help you create a fmdtools model by asking focused questions.",
+    "Let's get started!\n",
+])
 
+
+@lru_cache(maxsize=1)
 def _decision_schema() -> Dict[str, Any]:
-    """Return the JSON schema for AI responses."""
+    """Return the JSON schema for AI responses (built once; do not mutate)."""
     # Create a simplified schema that OpenAI can handle
     return {
         "type": "object",
@@ -184,11 +193,12 @@ class AIWizard:
                     
             except Exception as e:
                 if i == 3:  # Last retry
-                    if "rate_limit" in str(e).lower():
+                    err = str(e).lower()
+                    if "rate_limit" in err:
                         raise RuntimeError("API rate limit exceeded. Please wait a moment and try again.")
-                    elif "quota" in str(e).lower():
+                    elif "quota" in err:
                         raise RuntimeError("API quota exceeded. Please check your OpenAI account.")
-                    elif "timeout" in str(e).lower():
+                    elif "timeout" in err:
                         raise RuntimeError("API request timed out. Please try again.")
                     else:
                         raise RuntimeError(f"API call failed: {e}")
@@ -205,17 +215,16 @@ class AIWizard:
 
     def run(self) -> LevelSpec:
         """Run the AI wizard to collect information and generate a spec."""
-        print("\nAI Wizard Mode")
-        print("=" * 50)
-        print("I'll help you create a fmdtools model by asking focused questions.")
-        print("Let's get started!\n")
+        print(WELCOME_TEXT)
         
         # Seed with kickoff instruction
         self.messages.append({"role": "user", "content": "Start the intake. Ask the first question to understand what kind of system the user wants to model."})
         
         question_count = 0
-        while True:
-            try:
+        # Errors are reported once and re-raised, so the handler sits outside
+        # the loop rather than being re-entered on every turn
+        try:
+            while True:
                 # Truncate history if needed
                 self._truncate_history()
                 
@@ -274,10 +283,10 @@ class AIWizard:
                 else:
                     raise RuntimeError(f"Invalid action from AI: {data.get('action', 'unknown')}")
                     
-            except Exception as e:
-                print(f"\nError: {e}")
-                print("Please try again or use interactive mode instead.")
-                raise
+        except Exception as e:
+            print(f"\nError: {e}")
+            print("Please try again or use interactive mode instead.")
+            raise
 
     def get_conversation_summary(self) -> List[Dict[str, str]]:
         """Get a summary of the conversation for debugging."""
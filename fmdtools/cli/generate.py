@@ -4,20 +4,31 @@
 Code generator for fmdtools models from specifications.
 
 This module takes LevelSpec objects and renders them into
-Python files using Jinja2 templates.
+Python files using Jinja2 templates. Compiled template bytecode is cached
+under the user cache directory, keyed on the fmdtools version, so it is
+regenerated whenever fmdtools is upgraded.
 """
 
+import io
 import os
 import platform
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import typer
-from jinja2 import Environment, PackageLoader, select_autoescape
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
 
 from .schemas import LevelSpec, FunctionSpec, FlowSpec, ArchitectureSpec
 from .utils import sanitize_names
 
+# Characters deleted from architecture names to form class names
+_CLASS_NAME_DELETE = str.maketrans("", "", " !@#$%^&*()-+=[]{}\\|;:\"',.<>/?")
+
 
 def render_level(spec: LevelSpec, out_dir: str = ".", force: bool = False, dry_run: bool = False) -> List[Path]:
     """Render a complete level model from specification."""
@@ -27,6 +38,9 @@ def render_level(spec: LevelSpec, out_dir: str = ".", force: bool = False, dry_r
         [f.name for f in spec.functions], 
         [f.name for f in spec.flows]
     )
+    # Resolve each function's (func, safe_name, class_name) once
+    func_entries = [(func, *function_mapping[func.name]) for func in spec.functions]
+    arch_class_name = _arch_class_name(spec)
     
     out_path = Path(out_dir) / safe_spec_name
     
@@ -35,28 +49,22 @@ def render_level(spec: LevelSpec, out_dir: str = ".", force: bool = False, dry_r
     
     # Log version info and output path
     if not dry_run:
-        try:
-            import fmdtools  # type: ignore
-            typer.echo(f"fmdtools {getattr(fmdtools, '__version__', 'unknown')} • Python {platform.python_version()}")
-        except Exception:
-            typer.echo(f"fmdtools (unknown version) • Python {platform.python_version()}")
+        typer.echo(_banner())
         typer.echo(f"Output: {Path(out_dir).resolve() / safe_spec_name}")
     
     files = []
     
     # Check for existing files if not forcing (case-insensitive on Windows)
     if not force and not dry_run:
-        existing_files = []
-        for func in spec.functions:
-            safe_name = function_mapping[func.name][0]
-            if (out_path / f"{safe_name}.py").exists():
-                existing_files.append(f"{safe_name}.py")
-        if (out_path / "flows.py").exists():
-            existing_files.append("flows.py")
-        if (out_path / "architecture.py").exists():
-            existing_files.append("architecture.py")
-        if (out_path / f"level_{safe_spec_name}.py").exists():
-            existing_files.append(f"level_{safe_spec_name}.py")
+        # One directory listing instead of a stat call per candidate file
+        try:
+            with os.scandir(out_path) as it:
+                entries = {os.path.normcase(e.name) for e in it}
+        except FileNotFoundError:
+            entries = set()
+        candidates = [f"{safe_name}.py" for _, safe_name, _ in func_entries]
+        candidates += ["flows.py", "architecture.py", f"level_{safe_spec_name}.py"]
+        existing_files = [n for n in candidates if os.path.normcase(n) in entries]
         
         if existing_files:
             raise FileExistsError(
@@ -64,119 +72,125 @@ def render_level(spec: LevelSpec, out_dir: str = ".", force: bool = False, dry_r
                 f"Use --force to overwrite or --dry-run to preview."
             )
     
-    # Generate function files
-    for func in spec.functions:
-        safe_name, class_name = function_mapping[func.name]
-        target = out_path / f"{safe_name}.py"
-        content = render_function(func, spec, class_name)
+    # Dry-run output is collected and written to stdout in one go
+    dry_run_buffer = io.StringIO()
+
+    def show(target: Path, content: str):
+        dry_run_buffer.write(f"\n--- {target} ---\n")
+        dry_run_buffer.write(content)
+        dry_run_buffer.write("\n")
+
+    def write(target: Path, content: str):
+        # Write bytes directly to skip text-mode newline translation
+        target.write_bytes(content.encode("utf-8"))
+
+    def emit(target: Path, content: str):
         if dry_run:
-            print(f"\n--- {target} ---")
-            print(content)
+            show(target, content)
         else:
-            target.write_text(content)
+            write(target, content)
         files.append(target)
-    
-    # Generate flows file
-    if spec.flows:
-        target = out_path / "flows.py"
-        content = render_flows(spec, flow_mapping)
-        if dry_run:
-            print(f"\n--- {target} ---")
-            print(content)
+
+    def render_function_file(entry: Tuple[FunctionSpec, str, str]):
+        func, safe_name, class_name = entry
+        target = out_path / f"{safe_name}.py"
+        content = render_function(func, spec, class_name)
+        if not dry_run:
+            write(target, content)
+        return target, content
+
+    try:
+        # Generate function files, rendering and writing them in parallel for
+        # larger models (templates are loaded up front, outside the workers)
+        _get_templates()
+        if len(spec.functions) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(spec.functions))) as ex:
+                rendered = list(ex.map(render_function_file, func_entries))
         else:
-            target.write_text(content)
-        files.append(target)
-    
-    # Generate architecture file
-    target = out_path / "architecture.py"
-    content = render_architecture(spec, function_mapping, flow_mapping)
-    if dry_run:
-        print(f"\n--- {target} ---")
-        print(content)
-    else:
-        target.write_text(content)
-    files.append(target)
-    
-    # Generate main level file
-    target = out_path / f"level_{safe_spec_name}.py"
-    content = render_main_level(spec, safe_spec_name)
-    if dry_run:
-        print(f"\n--- {target} ---")
-        print(content)
-    else:
-        target.write_text(content)
-    files.append(target)
-    
-    # Generate __init__.py
-    target = out_path / "__init__.py"
-    content = render_init(spec, safe_spec_name)
-    if dry_run:
-        print(f"\n--- {target} ---")
-        print(content)
-    else:
-        target.write_text(content)
-    files.append(target)
-    
-    # Generate README.md
-    target = out_path / "README.md"
-    content = render_readme(spec, safe_spec_name, function_mapping, flow_mapping)
-    if dry_run:
-        print(f"\n--- {target} ---")
-        print(content)
-    else:
-        target.write_text(content)
-    files.append(target)
-    
+            rendered = [render_function_file(entry) for entry in func_entries]
+        for target, content in rendered:
+            if dry_run:
+                show(target, content)
+            files.append(target)
+
+        # Generate flows file
+        if spec.flows:
+            emit(out_path / "flows.py", render_flows(spec, flow_mapping))
+
+        # Generate architecture file
+        emit(out_path / "architecture.py",
+             render_architecture(spec, function_mapping, flow_mapping, arch_class_name))
+
+        # Generate main level file
+        emit(out_path / f"level_{safe_spec_name}.py",
+             render_main_level(spec, safe_spec_name, arch_class_name))
+
+        # Generate __init__.py
+        emit(out_path / "__init__.py", render_init(spec, safe_spec_name))
+
+        # Generate README.md
+        emit(out_path / "README.md",
+             render_readme(spec, safe_spec_name, function_mapping, flow_mapping))
+    finally:
+        if dry_run:
+            sys.stdout.write(dry_run_buffer.getvalue())
+
     return files
 
 
 def render_function(func: FunctionSpec, spec: LevelSpec, class_name: str) -> str:
     """Render a function template."""
-    template = env.get_template("function.py.j2")
+    template = _get_templates()["function"]
     return template.render(func=func, spec=spec, class_name=class_name)
 
 
 def render_flows(spec: LevelSpec, flow_mapping: dict) -> str:
     """Render flows template."""
-    template = env.get_template("flows.py.j2")
+    template = _get_templates()["flows"]
     return template.render(spec=spec, flows=spec.flows, flow_mapping=flow_mapping)
 
 
-def render_architecture(spec: LevelSpec, function_mapping: dict, flow_mapping: dict) -> str:
+def render_architecture(spec: LevelSpec, function_mapping: dict, flow_mapping: dict,
+                        arch_class_name: Optional[str] = None) -> str:
     """Render architecture template."""
-    template = env.get_template("architecture.py.j2")
-    # Create a proper architecture class name
-    arch_class_name = spec.architecture.name.replace(' ', '').replace('!', '').replace('@', '').replace('#', '').replace('$', '').replace('%', '').replace('^', '').replace('&', '').replace('*', '').replace('(', '').replace(')', '').replace('-', '').replace('+', '').replace('=', '').replace('[', '').replace(']', '').replace('{', '').replace('}', '').replace('\\', '').replace('|', '').replace(';', '').replace(':', '').replace('"', '').replace("'", '').replace(',', '').replace('.', '').replace('<', '').replace('>', '').replace('/', '').replace('?', '')
-    if arch_class_name[0].isdigit():
-        arch_class_name = '_' + arch_class_name
+    template = _get_templates()["architecture"]
+    if arch_class_name is None:
+        arch_class_name = _arch_class_name(spec)
     return template.render(spec=spec, arch=spec.architecture, functions=spec.functions, 
                          function_mapping=function_mapping, flow_mapping=flow_mapping,
                          arch_class_name=arch_class_name)
 
 
-def render_main_level(spec: LevelSpec, safe_spec_name: str) -> str:
+def render_main_level(spec: LevelSpec, safe_spec_name: str,
+                      arch_class_name: Optional[str] = None) -> str:
     """Render main level template."""
-    template = env.get_template("level.py.j2")
+    template = _get_templates()["level"]
     # Create a proper class name from the safe spec name
     class_name = safe_spec_name.replace('_', '').replace('-', '').title()
     if class_name[0].isdigit():
         class_name = '_' + class_name
-    # Create a proper architecture class name
-    arch_class_name = spec.architecture.name.replace(' ', '').replace('!', '').replace('@', '').replace('#', '').replace('$', '').replace('%', '').replace('^', '').replace('&', '').replace('*', '').replace('(', '').replace(')', '').replace('-', '').replace('+', '').replace('=', '').replace('[', '').replace(']', '').replace('{', '').replace('}', '').replace('\\', '').replace('|', '').replace(';', '').replace(':', '').replace('"', '').replace("'", '').replace(',', '').replace('.', '').replace('<', '').replace('>', '').replace('/', '').replace('?', '')
+    if arch_class_name is None:
+        arch_class_name = _arch_class_name(spec)
+    return template.render(spec=spec, safe_spec_name=safe_spec_name, class_name=class_name, arch_class_name=arch_class_name)
+
+
+def _arch_class_name(spec: LevelSpec) -> str:
+    """Create a proper architecture class name."""
+    arch_class_name = spec.architecture.name.translate(_CLASS_NAME_DELETE)
     if arch_class_name[0].isdigit():
         arch_class_name = '_' + arch_class_name
-    return template.render(spec=spec, safe_spec_name=safe_spec_name, class_name=class_name, arch_class_name=arch_class_name)
+    return arch_class_name
 
 
 def render_init(spec: LevelSpec, safe_spec_name: str) -> str:
     """Render __init__.py template."""
-    template = env.get_template("init.py.j2")
+    template = _get_templates()["init"]
     return template.render(spec=spec, safe_spec_name=safe_spec_name)
 
 
 def render_readme(spec: LevelSpec, safe_spec_name: str, function_mapping: dict, flow_mapping: dict) -> str:
     """Render README.md template."""
-    template = env.get_template("README.md.j2")
+    template = _get_env().get_template("README.md.j2")
     return template.render(
         spec=spec,
         safe_spec_name=safe_spec_name,
@@ -185,12 +199,63 @@ def render_readme(spec: LevelSpec, safe_spec_name: str, function_mapping: dict,
     )
 
 
-# Set up Jinja2 environment with custom filters and better defaults
-env = Environment(
-    loader=PackageLoader("fmdtools.cli", "templates"),
-    autoescape=False,
-    trim_blocks=True,
-    lstrip_blocks=True,
-    keep_trailing_newline=True
-)
-env.filters["pyrepr"] = repr
+@lru_cache(maxsize=1)
+def _banner() -> str:
+    """Return the fmdtools and Python version banner."""
+    try:
+        import fmdtools  # type: ignore
+        return f"fmdtools {getattr(fmdtools, '__version__', 'unknown')} • Python {platform.python_version()}"
+    except Exception:
+        return f"fmdtools (unknown version) • Python {platform.python_version()}"
+
+
+def _get_bytecode_cache() -> Optional["FileSystemBytecodeCache"]:
+    """Return a template bytecode cache for this fmdtools version, if writable."""
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        import fmdtools  # type: ignore
+        version = getattr(fmdtools, "__version__", "unknown")
+    except Exception:
+        version = "unknown"
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    directory = Path(base) / "fmdtools" / version / "jinja"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=str(directory))
+
+
+@lru_cache(maxsize=1)
+def _get_env() -> "Environment":
+    """Return the Jinja2 environment with custom filters and better defaults."""
+    # jinja2 is imported here so CLI commands that never render skip its import
+    from jinja2 import Environment, PackageLoader
+
+    env = Environment(
+        loader=PackageLoader("fmdtools.cli", "templates"),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        bytecode_cache=_get_bytecode_cache()
+    )
+    env.filters["pyrepr"] = repr
+    return env
+
+
+@lru_cache(maxsize=1)
+def _get_templates() -> Dict[str, "Template"]:
+    """Load the level templates once so rendering skips the loader checks."""
+    env = _get_env()
+    return {
+        "function": env.get_template("function.py.j2"),
+        "flows": env.get_template("flows.py.j2"),
+        "architecture": env.get_template("architecture.py.j2"),
+        "level": env.get_template("level.py.j2"),
+        "init": env.get_template("init.py.j2"),
+    }
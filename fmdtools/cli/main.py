@@ -17,16 +17,34 @@ import typer
 from typer import Exit
 
 from .schemas import LevelSpec, FunctionSpec, FlowSpec, ArchitectureSpec
-from .generate import render_level
-from .questions import ask_level_spec
 from .utils import sanitize_names
-from .ai_adapter import AIWizard
 
 app = typer.Typer(
     help="fmdtools scaffolding CLI - Create models from specifications",
     add_completion=False
 )
 
+TEMPLATES_TEXT = "\n".join([
+    "Available template types:",
+    "  level - Complete system model with functions, flows, and architecture",
+    "  function - Individual function block (coming soon)",
+    "  flow - Flow definition (coming soon)",
+])
+
+AI_SETUP_TEXT = "\n".join([
+    "AI Wizard Setup",
+    "=" * 30,
+    "To use the AI wizard, you need:",
+    "1. An OpenAI API key",
+    "2. A .env file in the fmdtools directory",
+    "\nCreate a .env file with:",
+    "OPENAI_API_KEY=sk-your-api-key-here",
+    "FMDTOOLS_AI_MODEL=gpt-4o-mini",
+    "\nThen run:",
+    "fmdtools create level --ai",
+    "\nThe AI will guide you through creating your model!",
+])
+
 
 @app.command("create")
 def create_level(
@@ -62,6 +80,7 @@ def create_level(
     if ai:
         try:
             typer.echo("Starting AI Wizard...")
+            from .ai_adapter import AIWizard
             wiz = AIWizard(model=model)
             
             # Add description seed if provided
@@ -102,6 +121,7 @@ def create_level(
             )
         else:
             # Interactive mode
+            from .questions import ask_level_spec
             spec = ask_level_spec(default_name=name, no_input=no_input)
             spec.is_quick_mode = quick
     
@@ -144,14 +164,15 @@ def create_level(
         raise Exit()
     
     # Generate files
+    from .generate import render_level
     try:
         paths = render_level(spec, out_dir=out, force=force, dry_run=dry_run)
         if dry_run:
             typer.echo("\nDry run completed. No files written.")
         else:
-            typer.echo(f"\nSuccessfully created {len(paths)} files:")
-            for path in paths:
-                typer.echo(f"  {path}")
+            lines = [f"\nSuccessfully created {len(paths)} files:"]
+            lines.extend(f"  {path}" for path in paths)
+            typer.echo("\n".join(lines))
             # Show absolute output path
             output_path = Path(out).resolve() / spec.name.lower()
             typer.echo(f"\nWrote {len(paths)} files to {output_path}")
@@ -252,26 +273,13 @@ def lint_level(
 @app.command("list-templates")
 def list_templates():
     """List available template types."""
-    typer.echo("Available template types:")
-    typer.echo("  level - Complete system model with functions, flows, and architecture")
-    typer.echo("  function - Individual function block (coming soon)")
-    typer.echo("  flow - Flow definition (coming soon)")
+    typer.echo(TEMPLATES_TEXT)
 
 
 @app.command("ai-setup")
 def ai_setup():
     """Help users set up AI wizard mode."""
-    typer.echo("AI Wizard Setup")
-    typer.echo("=" * 30)
-    typer.echo("To use the AI wizard, you need:")
-    typer.echo("1. An OpenAI API key")
-    typer.echo("2. A .env file in the fmdtools directory")
-    typer.echo("\nCreate a .env file with:")
-    typer.echo("OPENAI_API_KEY=sk-your-api-key-here")
-    typer.echo("FMDTOOLS_AI_MODEL=gpt-4o-mini")
-    typer.echo("\nThen run:")
-    typer.echo("fmdtools create level --ai")
-    typer.echo("\nThe AI will guide you through creating your model!")
+    typer.echo(AI_SETUP_TEXT)
 
 
 def main():
@@ -5,21 +5,41 @@ Utility functions for the fmdtools CLI.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 
+_SLUG_RE = re.compile(r"[^0-9a-zA-Z_]+")
+_LEAD_DIGIT_RE = re.compile(r"^[0-9]")
+_CLASS_SPLIT_RE = re.compile(r"[^0-9a-zA-Z]+")
 
+# ASCII fast path: map disallowed characters to spaces so str.split() can
+# collapse each run of them, as the regular expressions above do
+_SLUG_TABLE = str.maketrans({c: " " for c in map(chr, range(128))
+                             if not (c.isalnum() or c == "_")})
+_CLASS_TABLE = str.maketrans({c: " " for c in map(chr, range(128))
+                              if not c.isalnum()})
+
+
+@lru_cache(maxsize=1024)
 def slugify_module(s: str) -> str:
     """Convert string to valid Python module name."""
-    s = re.sub(r"[^0-9a-zA-Z_]+", "_", s).strip("_")
-    if re.match(r"^[0-9]", s):
+    if s.isascii():
+        s = "_".join(s.translate(_SLUG_TABLE).split()).strip("_")
+    else:
+        s = _SLUG_RE.sub("_", s).strip("_")
+    if _LEAD_DIGIT_RE.match(s):
         s = "_" + s
     return s.lower()
 
 
+@lru_cache(maxsize=1024)
 def to_class_name(s: str) -> str:
     """Convert string to valid Python class name."""
-    s = re.sub(r"[^0-9a-zA-Z]+", " ", s).title().replace(" ", "")
-    if re.match(r"^[0-9]", s):
+    if s.isascii():
+        s = s.translate(_CLASS_TABLE).title().replace(" ", "")
+    else:
+        s = _CLASS_SPLIT_RE.sub(" ", s).title().replace(" ", "")
+    if _LEAD_DIGIT_RE.match(s):
         s = "_" + s
     return s
 
@@ -28,23 +48,14 @@ def sanitize_names(spec_name: str, function_names: list, flow_names: list) -> Tu
     """Sanitize all names and return mappings."""
     safe_spec_name = slugify_module(spec_name)
     
-    # Sanitize function names
-    function_mapping = {}
-    safe_function_names = []
-    for name in function_names:
-        safe_name = slugify_module(name)
-        class_name = to_class_name(name)
-        function_mapping[name] = (safe_name, class_name)
-        safe_function_names.append(safe_name)
+    # Sanitize function and flow names in one pass, once per distinct name
+    mapping = {}
+    for name in (*function_names, *flow_names):
+        if name not in mapping:
+            mapping[name] = (slugify_module(name), to_class_name(name))
     
-    # Sanitize flow names
-    flow_mapping = {}
-    safe_flow_names = []
-    for name in flow_names:
-        safe_name = slugify_module(name)
-        class_name = to_class_name(name)
-        flow_mapping[name] = (safe_name, class_name)
-        safe_flow_names.append(safe_name)
+    function_mapping = {name: mapping[name] for name in function_names}
+    flow_mapping = {name: mapping[name] for name in flow_names}
     
     return safe_spec_name, function_mapping, flow_mapping
 